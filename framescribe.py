@@ -1,99 +1,95 @@
+import io
 import os
-import shutil
 import subprocess
 import re
 import math
+import multiprocessing
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from pathlib import Path
 
 try:
     import cv2  # OpenCV
+    import yt_dlp
     from PIL import Image
     from fpdf import FPDF
 except ImportError:
     print(
         "Missing required libraries. Please install them using:\n"
-        "pip install opencv-python Pillow fpdf2 yt-dlp"
+        "pip install opencv-python Pillow fpdf2 yt-dlp\n"
+        "(For 2-4x faster JPEG processing, pillow-simd built on\n"
+        "libjpeg-turbo is a drop-in replacement for Pillow:\n"
+        "pip install pillow-simd)"
     )
     exit(1)
 
+
+def _pillow_simd_hint():
+    """Suggests Pillow-SIMD if stock Pillow is installed.
+
+    All JPEG encoding here goes through Pillow, and Pillow-SIMD
+    (which reports versions like '9.0.0.post1') swaps the scalar
+    DCT/IDCT kernels for SIMD ones via libjpeg-turbo.
+    """
+    if ".post" not in getattr(Image, "__version__", ""):
+        print(
+            "Tip: pillow-simd (libjpeg-turbo) speeds up JPEG encode/decode "
+            "2-4x: pip install pillow-simd"
+        )
+
 # --- Configuration ---
 TARGET_PDF_SIZE_MB = 8
 COMPRESSED_IMAGE_QUALITY = 75  # JPEG quality for compression (0-100)
-TEMP_FRAME_DIR_NAME = "temp_frames"
+JPEG_QUALITY_RANGE = (40, 95)  # Search range for adaptive compression
+PAGE_DPI = 150  # Render density for frames embedded in the PDF
+WORKER_JPEG_QUALITY = 95  # Quality for worker-to-parent frame transport
+
+# Compiled once at import so repeated sanitize calls skip the re module's
+# per-call pattern lookup.
+_INVALID_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE_RE = re.compile(r"\s+")
 
 
 def sanitize_filename(name):
     """Removes invalid characters for filenames/directory names."""
-    name = re.sub(r'[<>:"/\\|?*]', "_", name)
-    name = re.sub(r"\s+", " ", name).strip()
-    return name
+    return _WHITESPACE_RE.sub(" ", _INVALID_CHARS_RE.sub("_", name)).strip()
 
 
 def get_video_info_and_download(youtube_url, base_output_dir):
     """
-    Downloads video, audio, subtitles using yt-dlp and gets video info.
-    Returns (title, video_path, srt_path, duration_seconds) or None on failure.
+    Downloads video, audio, subtitles via the yt-dlp library and gets video info.
+    Returns (title, video_path, srt_path, duration_seconds, output_dir) or
+    Nones on failure.
     """
     print(f"Attempting to download: {youtube_url}")
+    ydl_opts = {
+        # Format: best video (mp4) + best audio (m4a) / best (mp4 if already merged)
+        # Write auto-generated subs if available, convert to srt
+        "format": "bv*[ext=mp4]+ba[ext=m4a]/b[ext=mp4]/bv*+ba/b",
+        "writeautomaticsub": True,
+        "subtitlesformat": "srt",
+        "postprocessors": [
+            {"key": "FFmpegSubtitlesConvertor", "format": "srt"}
+        ],
+        "outtmpl": str(base_output_dir / "%(title)s" / "%(title)s.%(ext)s"),
+    }
     try:
-        # Get video title first to create the specific output directory
-        result = subprocess.run(
-            ["yt-dlp", "--get-title", "--get-duration", youtube_url],
-            capture_output=True,
-            text=True,
-            check=True,
-            encoding="utf-8",
-        )
-        lines = result.stdout.strip().split("\n")
-        video_title_raw = lines[0]
-        duration_str = lines[1]
-
-        # Parse duration (e.g., HH:MM:SS or MM:SS or SS)
-        parts = list(map(int, duration_str.split(":")))
-        if len(parts) == 3:
-            duration_seconds = parts[0] * 3600 + parts[1] * 60 + parts[2]
-        elif len(parts) == 2:
-            duration_seconds = parts[0] * 60 + parts[1]
-        else:
-            duration_seconds = parts[0]
+        # A single library call fetches metadata and downloads, instead of
+        # spawning yt-dlp twice (once for --get-title/--get-duration, once
+        # for the download itself).
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            info = ydl.extract_info(youtube_url, download=True)
+            downloaded_path = Path(ydl.prepare_filename(info))
+
+        video_title_raw = info.get("title") or "video"
+        # Duration is already an integer here; no HH:MM:SS parsing needed.
+        duration_seconds = int(info.get("duration") or 0)
 
         video_title_sanitized = sanitize_filename(video_title_raw)
-        specific_output_dir = base_output_dir / video_title_sanitized
-        os.makedirs(specific_output_dir, exist_ok=True)
+        specific_output_dir = downloaded_path.parent
         print(f"Video title: {video_title_raw}")
         print(f"Output will be in: {specific_output_dir}")
-
-        # Download video, audio (merged), and subtitles
-        # Format: best video (mp4) + best audio (m4a) / best (mp4 if already merged)
-        # Write auto-generated subs if available, convert to srt
-        yt_dlp_command = [
-            "yt-dlp",
-            "-f",
-            "bv*[ext=mp4]+ba[ext=m4a]/b[ext=mp4]/bv*+ba/b",
-            "--write-auto-subs",
-            "--sub-format",
-            "srt",
-            "--convert-subs",
-            "srt",
-            "-o",
-            str(specific_output_dir / "%(title)s.%(ext)s"),
-            youtube_url,
-        ]
-
-        print(f"Running yt-dlp: {' '.join(yt_dlp_command)}")
-        process = subprocess.Popen(
-            yt_dlp_command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-        )
-        stdout, stderr = process.communicate()
-
-        if process.returncode != 0:
-            print("yt-dlp Error:")
-            print(stdout.decode(errors="ignore"))
-            print(stderr.decode(errors="ignore"))
-            return None, None, None, 0
-
         print("Download process finished.")
 
         # Find the downloaded video and srt files
@@ -123,7 +119,7 @@ def get_video_info_and_download(youtube_url, base_output_dir):
                      break
             if not video_path:
                 print("Still no video file found. Check download output.")
-                return None, None, None, 0
+                return None, None, None, 0, None
 
 
         if srt_path:
@@ -139,14 +135,8 @@ def get_video_info_and_download(youtube_url, base_output_dir):
             specific_output_dir,
         )
 
-    except subprocess.CalledProcessError as e:
-        print(f"Error getting video info with yt-dlp: {e}")
-        print(e.stderr)
-        return None, None, None, 0, None
-    except FileNotFoundError:
-        print(
-            "Error: yt-dlp command not found. Is it installed and in your PATH?"
-        )
+    except yt_dlp.utils.DownloadError as e:
+        print(f"yt-dlp Error: {e}")
         return None, None, None, 0, None
     except Exception as e:
         print(f"An unexpected error occurred during download: {e}")
@@ -196,82 +186,184 @@ def format_timestamp(seconds):
     return f"{hours:02}:{minutes:02}:{seconds_val:02}.{milliseconds:03}"
 
 
-def extract_frames(
-    video_path, interval_seconds, num_expected_frames, output_folder
-):
-    """Extracts frames from video and saves them with timestamped names."""
+# FourCC codes where per-sample seeking is slower than sequential decode
+# (H.264 seeks typically cost 50-100ms each, so we only seek for other codecs).
+H264_FOURCC_CODES = {"avc1", "h264", "x264"}
+
+
+def _fourcc_to_str(fourcc_value):
+    """Decodes OpenCV's numeric FOURCC property into a 4-character string."""
+    code = int(fourcc_value)
+    return "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4))
+
+
+def _extract_chunk(task):
+    """Extracts one chunk of sample timestamps from the video.
+
+    Runs in a worker process with its own VideoCapture. Returns a list
+    of (jpeg_bytes, timestamp_str) tuples for the chunk; frames are
+    JPEG-encoded here so only compact buffers cross the process
+    boundary instead of raw pixel arrays.
+    """
+    video_path, samples, use_seeking, fps = task
+    results = []
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        print(f"Error: Worker could not open video file {video_path}")
+        return results
+
+    if use_seeking:
+        # Seek straight to each sample instead of decoding every frame
+        # in between.
+        for current_time_seconds, timestamp_str in samples:
+            cap.set(cv2.CAP_PROP_POS_MSEC, current_time_seconds * 1000.0)
+            success, image = cap.read()
+            if not success:
+                break # Past end of video or decode error
+            encoded, jpeg_array = cv2.imencode(
+                ".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, WORKER_JPEG_QUALITY]
+            )
+            if not encoded:
+                print(f"Warning: Could not encode frame at {timestamp_str}")
+                continue
+            results.append((jpeg_array.tobytes(), timestamp_str))
+            print(f"Extracted frame at {timestamp_str}")
+    else:
+        # H.264 seeks are expensive, so seek once to the chunk start and
+        # demux sequentially: grab() is cheap, and the full decode via
+        # retrieve() happens only at sample frames.
+        cap.set(cv2.CAP_PROP_POS_MSEC, samples[0][0] * 1000.0)
+        frame_pos = int(cap.get(cv2.CAP_PROP_POS_FRAMES))
+        for current_time_seconds, timestamp_str in samples:
+            # The seek may land a frame past the computed index when the
+            # two roundings disagree (e.g. 29.97 fps); clamping keeps at
+            # least one grab() before retrieve(), turning an overshoot
+            # into an off-by-one frame instead of a failed chunk.
+            target_pos = max(
+                int(round(current_time_seconds * fps)), frame_pos
+            )
+            success = True
+            while success and frame_pos <= target_pos:
+                success = cap.grab()
+                frame_pos += 1
+            if success:
+                success, image = cap.retrieve()
+            if not success:
+                break # No more frames or error
+            encoded, jpeg_array = cv2.imencode(
+                ".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, WORKER_JPEG_QUALITY]
+            )
+            if not encoded:
+                print(f"Warning: Could not encode frame at {timestamp_str}")
+                continue
+            results.append((jpeg_array.tobytes(), timestamp_str))
+            print(f"Extracted frame at {timestamp_str}")
+
+    cap.release()
+    return results
+
+
+def extract_frames(video_path, interval_seconds, num_expected_frames):
+    """Extracts frames from video, yielding (jpeg_bytes, timestamp_str) pairs.
+
+    A generator: each chunk of samples is yielded as soon as its worker
+    finishes, so downstream PDF encoding can overlap with decoding of
+    the remaining chunks.
+    """
     print(f"Extracting frames from {video_path.name}...")
     cap = cv2.VideoCapture(str(video_path))
     if not cap.isOpened():
         print(f"Error: Could not open video file {video_path}")
-        return []
+        return
 
     fps = cap.get(cv2.CAP_PROP_FPS)
-    if fps == 0:
-        print("Warning: Video FPS is 0. Cannot extract frames accurately by time.")
-        # Fallback: try to use num_expected_frames if interval was based on duration
-        total_frames_video = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        if num_expected_frames > 0 and total_frames_video > 0:
-            frame_step = max(1, total_frames_video // num_expected_frames)
-            print(f"Using fallback frame step: {frame_step}")
-        else:
-            cap.release()
-            return [] # Cannot proceed
-    else:
-        frame_step = int(fps * interval_seconds)
-        if frame_step == 0: # for very small intervals and low fps
-            frame_step = 1
+    fourcc_str = _fourcc_to_str(cap.get(cv2.CAP_PROP_FOURCC)).lower()
+    cap.release()
 
+    if num_expected_frames <= 0:
+        print("No frames expected. Nothing to extract.")
+        return
 
-    frame_data = []  # List of (frame_path, timestamp_str)
+    if fps == 0:
+        print("Warning: Video FPS is 0. Falling back to time-based seeking.")
+    use_seeking = fourcc_str not in H264_FOURCC_CODES or fps == 0
+
+    # Sample times form a known arithmetic progression, so precompute all
+    # (time, timestamp_str) pairs in one pass up front instead of paying
+    # the timedelta/divmod/format overhead once per frame in the workers.
+    samples = [
+        (i * interval_seconds, format_timestamp(i * interval_seconds))
+        for i in range(num_expected_frames)
+    ]
+
+    # Decode is CPU bound on a single core, but chunks of the timeline can
+    # be decoded independently, so split the samples across processes.
+    num_workers = min(os.cpu_count() or 1, len(samples))
+    chunk_size = math.ceil(len(samples) / num_workers)
+    tasks = [
+        (
+            str(video_path),
+            samples[start:start + chunk_size],
+            use_seeking,
+            fps,
+        )
+        for start in range(0, len(samples), chunk_size)
+    ]
 
-    temp_frames_path = output_folder / TEMP_FRAME_DIR_NAME
-    os.makedirs(temp_frames_path, exist_ok=True)
+    print(
+        f"Codec '{fourcc_str}': extracting {len(samples)} samples "
+        f"across {len(tasks)} worker(s)."
+    )
+    extracted_count = 0
+    with multiprocessing.Pool(len(tasks)) as pool:
+        # imap hands back chunks as they complete (in order), so the
+        # consumer starts on the first chunk while later ones decode.
+        for chunk_results in pool.imap(_extract_chunk, tasks):
+            extracted_count += len(chunk_results)
+            yield from chunk_results
 
-    frame_count = 0
-    saved_frame_count = 0
-    success = True
+    print(f"Finished extracting {extracted_count} frames.")
 
-    while success:
-        if frame_count % frame_step == 0:
-            success, image = cap.read()
-            if success:
-                current_time_seconds = frame_count / fps if fps > 0 else 0
-                timestamp_str = format_timestamp(current_time_seconds)
-                frame_filename = f"frame_{timestamp_str.replace(':', '-').replace('.', '_')}.jpg"
-                frame_filepath = temp_frames_path / frame_filename
-
-                cv2.imwrite(str(frame_filepath), image)
-                frame_data.append((frame_filepath, timestamp_str))
-                saved_frame_count += 1
-                print(f"Saved frame {saved_frame_count} at {timestamp_str}")
-            else:
-                break # No more frames or error
-        else:
-            # Skip frame to maintain interval, but still need to read it
-            success = cap.grab()
-            if not success:
-                break
 
-        frame_count += 1
-        if saved_frame_count >= num_expected_frames * 2 and num_expected_frames > 0 : # Safety break
-            print("Warning: Extracted significantly more frames than expected. Stopping.")
-            break
+def _find_quality(img, target_bytes, save_kwargs):
+    """Bisects JPEG quality so the encoded frame fits its byte budget.
 
-
-    cap.release()
-    print(f"Finished extracting {saved_frame_count} frames.")
-    return frame_data
+    Returns the BytesIO of the highest-quality encode not exceeding
+    target_bytes, or the smallest encode tried if none fit.
+    """
+    low, high = JPEG_QUALITY_RANGE
+    best_buffer = None
+    while low <= high:
+        quality = (low + high) // 2
+        buffer = io.BytesIO()
+        img.save(buffer, "JPEG", quality=quality, **save_kwargs)
+        if buffer.tell() <= target_bytes:
+            best_buffer = buffer
+            low = quality + 1
+        else:
+            high = quality - 1
+    if best_buffer is None:
+        best_buffer = buffer # Nothing fit; keep the lowest-quality attempt
+    return best_buffer
 
 
 def create_pdf_from_frames(
-    frame_data, output_pdf_path, compress_mode=False
+    frame_data, output_pdf_path, compress_mode=False, expected_frame_count=0
 ):
-    """Creates a PDF from frame images, optionally compressing them."""
+    """Creates a PDF from frame images, optionally compressing them.
+
+    frame_data may be any iterable of (jpeg_bytes, timestamp_str) pairs,
+    including the extract_frames generator, so page encoding overlaps
+    with frame extraction. Returns the number of pages added.
+    """
     print(f"Creating PDF: {output_pdf_path.name}...")
     pdf = FPDF(orientation="L", unit="mm", format="A4") # Landscape A4
     pdf.set_auto_page_break(auto=True, margin=15)
     pdf.set_font("Arial", size=10)
+    # Every page image arrives as an already-encoded JPEG buffer; pinning
+    # the image filter to DCTDecode makes fpdf2 inline those bytes
+    # verbatim in the PDF stream, never re-encoding them.
+    pdf.set_image_filter("DCTDecode")
 
     # A4 Landscape dimensions in mm: 297 wide x 210 high
     # Margins (approximate, can be adjusted)
@@ -280,65 +372,152 @@ def create_pdf_from_frames(
     page_width_mm = pdf.w - 2 * margin_x
     page_height_mm = pdf.h - 2 * margin_y
 
-    for frame_path, timestamp_str in frame_data:
+    # Per-frame byte budget so the compressed PDF lands under the target
+    # in one pass instead of rebuilding at ever-lower fixed qualities.
+    # frame_data may be a generator, so the budget comes from the
+    # expected frame count rather than len().
+    target_bytes_per_frame = None
+    if compress_mode and expected_frame_count > 0:
+        target_bytes_per_frame = (
+            TARGET_PDF_SIZE_MB * 1024 * 1024 / expected_frame_count
+        )
+
+    def _encode_page(frame_item):
+        """Resizes and JPEG-encodes one frame for its PDF page.
+
+        Runs in a thread; Pillow releases the GIL inside libjpeg, so
+        encodes overlap. Returns (jpeg_buffer, pos_x, pos_y,
+        display_w_mm, display_h_mm, timestamp_str), or None on failure.
+        """
+        jpeg_bytes, timestamp_str = frame_item
         try:
-            img = Image.open(frame_path)
+            # Lazy open: only the JPEG header is read until load().
+            img = Image.open(io.BytesIO(jpeg_bytes))
             img_w_px, img_h_px = img.size
 
             # Calculate image dimensions to fit page while maintaining aspect ratio
             aspect_ratio = img_w_px / img_h_px
-            
+
             display_w_mm = page_width_mm
             display_h_mm = display_w_mm / aspect_ratio
 
             if display_h_mm > page_height_mm:
                 display_h_mm = page_height_mm
                 display_w_mm = display_h_mm * aspect_ratio
-            
+
             # Center image
             pos_x = (pdf.w - display_w_mm) / 2
             pos_y = (pdf.h - display_h_mm - 10) / 2 # Extra 10mm for timestamp
 
+            # Anything beyond PAGE_DPI at the displayed size is invisible
+            # in the PDF, so downscale before encoding rather than pushing
+            # wasted pixels through the JPEG encoder.
+            target_w_px = int(display_w_mm / 25.4 * PAGE_DPI)
+            if not compress_mode and img_w_px <= target_w_px:
+                # Already at page resolution: embed the worker's JPEG
+                # bytes verbatim, with no decode or re-encode at all.
+                jpeg_buffer = io.BytesIO(jpeg_bytes)
+            else:
+                if img_w_px > target_w_px:
+                    target_h_px = int(round(target_w_px / aspect_ratio))
+                    # draft() asks libjpeg to decode at a reduced 1/2,
+                    # 1/4 or 1/8 scale straight from the DCT domain, so
+                    # most of the IDCT work for oversized sources never
+                    # happens; reducing_gap keeps the remaining LANCZOS
+                    # pass cheap too.
+                    img.draft("RGB", (target_w_px, target_h_px))
+                    img = img.resize(
+                        (target_w_px, target_h_px),
+                        Image.LANCZOS,
+                        reducing_gap=2.0,
+                    )
+
+                # Encode once in memory; fpdf2 accepts file-like objects,
+                # so nothing touches disk between decode and embed.
+                # Progressive JPEG with optimized Huffman tables shaves
+                # another ~7-20% off the file size for almost no extra CPU.
+                if compress_mode:
+                    # 4:2:0 chroma subsampling is invisible at print
+                    # density and shrinks the compressed output further.
+                    save_kwargs = {
+                        "optimize": True,
+                        "progressive": True,
+                        "subsampling": 2,
+                    }
+                    if target_bytes_per_frame is not None:
+                        jpeg_buffer = _find_quality(
+                            img, target_bytes_per_frame, save_kwargs
+                        )
+                    else:
+                        # No frame count, no byte budget: fall back to
+                        # the fixed compression quality.
+                        jpeg_buffer = io.BytesIO()
+                        img.save(
+                            jpeg_buffer,
+                            "JPEG",
+                            quality=COMPRESSED_IMAGE_QUALITY,
+                            **save_kwargs,
+                        )
+                else:
+                    jpeg_buffer = io.BytesIO()
+                    img.save(
+                        jpeg_buffer,
+                        "JPEG",
+                        quality=90,
+                        optimize=True,
+                        progressive=True,
+                    )
+            return (
+                jpeg_buffer,
+                pos_x,
+                pos_y,
+                display_w_mm,
+                display_h_mm,
+                timestamp_str,
+            )
+        except Exception as e:
+            print(f"Error processing frame at {timestamp_str} for PDF: {e}")
+            return None # Skip problematic frame
+
+    # FPDF itself is not thread-safe, so only the encode step runs in the
+    # pool; pages are appended sequentially, in order. executor.map pulls
+    # frames from frame_data as they are submitted, so already-submitted
+    # encodes run while extraction is still producing later frames.
+    page_count = 0
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for encoded_page in executor.map(_encode_page, frame_data):
+            if encoded_page is None:
+                continue
+            (
+                jpeg_buffer,
+                pos_x,
+                pos_y,
+                display_w_mm,
+                display_h_mm,
+                timestamp_str,
+            ) = encoded_page
+
             pdf.add_page()
+            pdf.image(
+                jpeg_buffer,
+                x=pos_x,
+                y=pos_y,
+                w=display_w_mm,
+                h=display_h_mm,
+            )
 
-            if compress_mode:
-                # Save to a temporary compressed file before adding to PDF
-                temp_compressed_path = frame_path.with_suffix(
-                    ".compressed.jpg"
-                )
-                img.save(
-                    temp_compressed_path,
-                    "JPEG",
-                    quality=COMPRESSED_IMAGE_QUALITY,
-                    optimize=True
-                )
-                pdf.image(
-                    str(temp_compressed_path),
-                    x=pos_x,
-                    y=pos_y,
-                    w=display_w_mm,
-                    h=display_h_mm,
-                )
-                os.remove(temp_compressed_path) # Clean up temp compressed
-            else:
-                pdf.image(
-                    str(frame_path),
-                    x=pos_x,
-                    y=pos_y,
-                    w=display_w_mm,
-                    h=display_h_mm,
-                )
-            
             # Add timestamp
             pdf.set_xy(pos_x, pos_y + display_h_mm + 2) # Position below image
             pdf.cell(display_w_mm, 8, txt=timestamp_str, ln=1, align="C")
+            page_count += 1
 
-        except Exception as e:
-            print(f"Error processing frame {frame_path.name} for PDF: {e}")
-            continue # Skip problematic frame
+    if page_count == 0:
+        print("No frames to add to PDF.")
+        return 0
 
     pdf.output(str(output_pdf_path), "F")
     print("PDF created successfully.")
+    return page_count
 
 
 def open_folder(folder_path):
@@ -359,6 +538,7 @@ def open_folder(folder_path):
 def main():
     script_dir = Path(__file__).parent.resolve()
     print(f"Script running in: {script_dir}")
+    _pillow_simd_hint()
 
     youtube_url = input("Enter YouTube video URL: ").strip()
     if not youtube_url:
@@ -418,10 +598,36 @@ def main():
         open_folder(output_dir)
         return
 
+    # Decide on compression up front so every frame is encoded exactly
+    # once, at its final quality, instead of building an uncompressed PDF
+    # and then re-encoding everything for a compressed rebuild.
+    compress_choice = (
+        input(f"Compress the PDF to stay under {TARGET_PDF_SIZE_MB}MB? (y/n): ")
+        .strip()
+        .lower()
+    )
+    compress_mode = compress_choice == "y"
+
+    if compress_mode:
+        pdf_filename = f"{video_title}_frames_compressed.pdf"
+    else:
+        print("Skipping PDF compression.")
+        pdf_filename = f"{video_title}_frames.pdf"
+    output_pdf_path = output_dir / pdf_filename
+
+    # extract_frames is a generator, so the PDF stage encodes pages while
+    # later chunks of the video are still being decoded: the two stages
+    # run as a pipeline instead of back to back.
     frame_data = extract_frames(
-        video_path, interval_seconds, num_expected_frames, output_dir
+        video_path, interval_seconds, num_expected_frames
+    )
+    pages_added = create_pdf_from_frames(
+        frame_data,
+        output_pdf_path,
+        compress_mode=compress_mode,
+        expected_frame_count=num_expected_frames,
     )
-    if not frame_data:
+    if pages_added == 0:
         print("No frames were extracted. Exiting.")
         # Clean up video, keep srt
         if video_path and video_path.exists():
@@ -429,78 +635,21 @@ def main():
             video_path.unlink()
         open_folder(output_dir)
         return
-
-    pdf_filename = f"{video_title}_frames.pdf"
-    output_pdf_path = output_dir / pdf_filename
-    compressed_pdf_path = output_dir / f"{video_title}_frames_compressed.pdf"
-
-    # Initial PDF creation (uncompressed)
-    create_pdf_from_frames(frame_data, output_pdf_path, compress_mode=False)
     final_pdf_path = output_pdf_path
 
     if output_pdf_path.exists():
-        compress_choice = (
-            input("Do you want to try to compress the PDF (e.g., under 8MB)? (y/n): ")
-            .strip()
-            .lower()
-        )
-        if compress_choice == "y":
-            print(
-                f"Attempting to compress PDF by reducing image quality to {COMPRESSED_IMAGE_QUALITY}%..."
-            )
-            create_pdf_from_frames(
-                frame_data, compressed_pdf_path, compress_mode=True
-            )
-            if compressed_pdf_path.exists():
-                original_size = output_pdf_path.stat().st_size
-                compressed_size = compressed_pdf_path.stat().st_size
-                print(
-                    f"Original PDF size: {original_size / (1024*1024):.2f} MB"
-                )
+        pdf_size = output_pdf_path.stat().st_size
+        print(f"PDF size: {pdf_size / (1024*1024):.2f} MB")
+        if compress_mode:
+            if pdf_size < TARGET_PDF_SIZE_MB * 1024 * 1024:
+                print(f"Compressed PDF is under {TARGET_PDF_SIZE_MB}MB.")
+            else:
                 print(
-                    f"Compressed PDF size: {compressed_size / (1024*1024):.2f} MB"
+                    "Compressed PDF is still over target; frames could not "
+                    "be shrunk further without going below minimum quality."
                 )
-
-                if compressed_size < TARGET_PDF_SIZE_MB * 1024 * 1024:
-                    print(
-                        f"Compressed PDF is under {TARGET_PDF_SIZE_MB}MB."
-                    )
-                    # Delete uncompressed, use compressed
-                    output_pdf_path.unlink()
-                    final_pdf_path = compressed_pdf_path
-                elif compressed_size < original_size:
-                    print(
-                        "Compression reduced size, but may still be over target."
-                    )
-                    # Ask user which one to keep
-                    keep_compressed = input(
-                        f"Compressed PDF is {compressed_size / (1024*1024):.2f}MB. Keep compressed version? (y/n): "
-                    ).strip().lower()
-                    if keep_compressed == 'y':
-                        output_pdf_path.unlink()
-                        final_pdf_path = compressed_pdf_path
-                    else:
-                        compressed_pdf_path.unlink()
-                        final_pdf_path = output_pdf_path # Keep original
-                else:
-                    print(
-                        "Compression did not reduce size or failed. Keeping original."
-                    )
-                    if compressed_pdf_path.exists():
-                        compressed_pdf_path.unlink() # Delete ineffective compressed version
-                    final_pdf_path = output_pdf_path
-            else:
-                print("Compression attempt failed. Keeping original PDF.")
-        else:
-            print("Skipping PDF compression.")
     else:
-        print("PDF creation failed. No PDF to compress.")
-
-    # Clean up temporary frame images
-    temp_frames_full_path = output_dir / TEMP_FRAME_DIR_NAME
-    if temp_frames_full_path.exists():
-        print(f"Deleting temporary frames from: {temp_frames_full_path}")
-        shutil.rmtree(temp_frames_full_path)
+        print("PDF creation failed.")
 
     # Delete original video file
     if video_path and video_path.exists():